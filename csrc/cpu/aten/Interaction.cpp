@@ -17,6 +17,7 @@ namespace torch_ipex {
 namespace cpu {
 
 DEFINE_DISPATCH(interaction_forward_kernel_stub);
+DEFINE_DISPATCH(interaction_forward_stacked_kernel_stub);
 DEFINE_DISPATCH(interaction_backward_kernel_stub);
 DEFINE_DISPATCH(dil_qinteraction_kernel_stub);
 
@@ -25,6 +26,11 @@ at::Tensor _interaction_forward(const std::vector<at::Tensor>& input) {
   return interaction_forward_kernel_stub(kCPU, input);
 }
 
+at::Tensor _interaction_forward_stacked(const at::Tensor& input) {
+  // pointer to interaction_forward_stacked_kernel_impl(input);
+  return interaction_forward_stacked_kernel_stub(kCPU, input);
+}
+
 std::vector<at::Tensor> _interaction_backward(
     const at::Tensor& grad_out,
     const std::vector<at::Tensor>& input) {
@@ -50,6 +56,10 @@ at::Tensor interaction_forward(const std::vector<at::Tensor>& input) {
   return cpu::_interaction_forward(input);
 }
 
+at::Tensor interaction_forward_stacked(const at::Tensor& input) {
+  return cpu::_interaction_forward_stacked(input);
+}
+
 std::vector<at::Tensor> interaction_backward(
     const at::Tensor& grad_out,
     const std::vector<at::Tensor>& input) {
@@ -65,6 +75,11 @@ TORCH_LIBRARY_FRAGMENT(torch_ipex, m) {
           "torch_ipex::interaction_forward(Tensor[] input) -> Tensor",
           c10::AliasAnalysisKind::PURE_FUNCTION),
       torch_ipex::interaction_forward);
+  m.def(
+      torch::schema(
+          "torch_ipex::interaction_forward_stacked(Tensor input) -> Tensor",
+          c10::AliasAnalysisKind::PURE_FUNCTION),
+      torch_ipex::interaction_forward_stacked);
   m.def(
       torch::schema(
           "torch_ipex::interaction_backward(Tensor grad_out, "
@@ -89,8 +104,22 @@ at::Tensor interaction_forward(const std::vector<at::Tensor>& input) {
   return op.call(cpu_cached_cast(type, input));
 }
 
+at::Tensor interaction_forward_stacked(const at::Tensor& input) {
+  c10::impl::ExcludeDispatchKeyGuard no_autocastCPU(DispatchKey::AutocastCPU);
+  static auto op =
+      torch::Dispatcher::singleton()
+          .findSchemaOrThrow("torch_ipex::interaction_forward_stacked", "")
+          .typed<decltype(interaction_forward_stacked)>();
+
+  auto type = promote_type(get_autocast_dtype(), input);
+  return op.call(cpu_cached_cast(type, input));
+}
+
 TORCH_LIBRARY_IMPL(torch_ipex, AutocastCPU, m) {
   m.impl("interaction_forward", torch_ipex::autocast::interaction_forward);
+  m.impl(
+      "interaction_forward_stacked",
+      torch_ipex::autocast::interaction_forward_stacked);
 }
 
 } // namespace autocast
@@ -7,6 +7,7 @@
 namespace torch_ipex {
 
 at::Tensor interaction_forward(const std::vector<at::Tensor>& input);
+at::Tensor interaction_forward_stacked(const at::Tensor& input);
 std::vector<at::Tensor> interaction_backward(
     const at::Tensor& grad_out,
     const std::vector<at::Tensor>& input);
@@ -21,6 +22,8 @@ namespace {
 at::Tensor interaction_forward_kernel_impl(
     const std::vector<at::Tensor>& input);
 
+at::Tensor interaction_forward_stacked_kernel_impl(const at::Tensor& input);
+
 std::vector<at::Tensor> interaction_backward_kernel_impl(
     const at::Tensor& grad_out,
     const std::vector<at::Tensor>& input);
@@ -39,6 +42,11 @@ DECLARE_DISPATCH(
     interaction_forward_kernel_fn,
     interaction_forward_kernel_stub);
 
+using interaction_forward_stacked_kernel_fn = at::Tensor (*)(const at::Tensor&);
+DECLARE_DISPATCH(
+    interaction_forward_stacked_kernel_fn,
+    interaction_forward_stacked_kernel_stub);
+
 using interaction_backward_kernel_fn = std::vector<at::Tensor> (*)(
     const at::Tensor&,
     const std::vector<at::Tensor>&);
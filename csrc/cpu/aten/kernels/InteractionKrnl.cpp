@@ -362,6 +362,49 @@ inline at::Tensor _interaction_forward(const std::vector<at::Tensor>& input) {
   return out;
 }
 
+template <typename T>
+inline at::Tensor _interaction_forward_stacked(const at::Tensor& input) {
+  RECORD_FUNCTION(
+      "_interaction_forward_stacked", c10::ArrayRef<c10::IValue>({}));
+  TORCH_CHECK(input.dim() == 3, "expect a stacked (B, N, D) input");
+  TORCH_CHECK(
+      input.is_contiguous(),
+      "expect a contiguous stacked input; the kernel indexes the raw buffer");
+  int64_t batch_size = input.sizes()[0];
+  uint32_t feature_nums = input.sizes()[1];
+  uint32_t feature_size = input.sizes()[2];
+  auto input_data = input.data_ptr<T>();
+  auto interact_feature_size = feature_nums * (feature_nums - 1) / 2;
+  auto out_data_line_len = interact_feature_size + feature_size;
+  auto in_data_line_len = (int64_t)feature_nums * feature_size;
+  auto out = at::empty({batch_size, out_data_line_len}, input.options());
+  auto out_data = out.data_ptr<T>();
+
+  at::parallel_for(0, batch_size, 0, [&](int64_t start, int64_t end) {
+    T* in_ptr = &input_data[start * in_data_line_len];
+    for (int64_t i = start; i < end; i++) {
+      // the dense feature is row 0 of the stacked input; its copy plus the
+      // flat upper triangle are written straight into the output line, so no
+      // intermediate cat buffer is materialized.
+      move_ker(&out_data[i * out_data_line_len], in_ptr, feature_size);
+      T* flat_buf = (T*)(&out_data[i * out_data_line_len] + feature_size);
+      auto o_offset = interact_feature_size;
+      for (int f1 = feature_nums - 1; f1 > 0; f1--) {
+        o_offset = o_offset - f1;
+        T* v1 = in_ptr + (int64_t)f1 * feature_size;
+        for (int f2 = 0; f2 < f1; f2++) {
+          T* v2 = in_ptr + (int64_t)f2 * feature_size;
+          T* out = flat_buf + o_offset + f2;
+          dot_product<T>(out, v1, v2, feature_size);
+        }
+      }
+      in_ptr += in_data_line_len;
+    }
+  });
+
+  return out;
+}
+
 template <typename T>
 inline std::vector<at::Tensor> _interaction_backward(
     const at::Tensor& grad_out,
@@ -767,7 +810,7 @@ inline std::vector<at::Tensor> _interaction_backward<at::BFloat16>(
 at::Tensor interaction_forward_kernel_impl(
     const std::vector<at::Tensor>& input) {
   if (input[0].scalar_type() == at::kFloat) {
-    for (auto& in : input) {
+    for (const auto& in : input) {
       TORCH_INTERNAL_ASSERT_DEBUG_ONLY(in.scalar_type() == at::kFloat);
     }
     return _interaction_forward<float>(input);
@@ -780,6 +823,15 @@ at::Tensor interaction_forward_kernel_impl(
   }
 }
 
+at::Tensor interaction_forward_stacked_kernel_impl(const at::Tensor& input) {
+  if (input.scalar_type() == at::kFloat) {
+    return _interaction_forward_stacked<float>(input);
+  } else {
+    TORCH_INTERNAL_ASSERT_DEBUG_ONLY(input.scalar_type() == at::kBFloat16);
+    return _interaction_forward_stacked<at::BFloat16>(input);
+  }
+}
+
 std::vector<at::Tensor> interaction_backward_kernel_impl(
     const at::Tensor& grad_out,
     const std::vector<at::Tensor>& input) {
@@ -1024,7 +1076,6 @@ at::Tensor dil_qinteraction_kernel_impl(
     int64_t o_zp,
     at::ScalarType o_dtype) {
   uint32_t feature_nums = input.size();
-  uint32_t total_feature_size = 0;
   int64_t batch_size = input[0].sizes()[0];
   uint32_t feature_size = input[0].sizes()[1];
 
@@ -1144,6 +1195,9 @@ at::Tensor dil_qinteraction_kernel_impl(
 REGISTER_DISPATCH(
     interaction_forward_kernel_stub,
     &interaction_forward_kernel_impl);
+REGISTER_DISPATCH(
+    interaction_forward_stacked_kernel_stub,
+    &interaction_forward_stacked_kernel_impl);
 REGISTER_DISPATCH(
     interaction_backward_kernel_stub,
     &interaction_backward_kernel_impl);
@@ -649,3 +649,33 @@ def meta_rotary_position_embedding_out(
     rotary_ndims,
 ):
     return t_in
+
+
+@register_meta("interaction_forward")
+def meta_interaction_forward(
+    input,
+):
+    batch_size = input[0].shape[0]
+    feature_size = input[0].shape[1]
+    feature_nums = len(input)
+    interact_feature_size = feature_nums * (feature_nums - 1) // 2
+    return input[0].new_empty((batch_size, feature_size + interact_feature_size))
+
+
+@register_meta("interaction_forward_stacked")
+def meta_interaction_forward_stacked(
+    input,
+):
+    batch_size = input.shape[0]
+    feature_nums = input.shape[1]
+    feature_size = input.shape[2]
+    interact_feature_size = feature_nums * (feature_nums - 1) // 2
+    return input.new_empty((batch_size, feature_size + interact_feature_size))
+
+
+@register_meta("interaction_backward")
+def meta_interaction_backward(
+    grad_out,
+    input,
+):
+    return [grad_out.new_empty(t.shape) for t in input]
@@ -25,20 +25,137 @@ def interaction(*args):
             Output shape: ``(B, D + N * ( N - 1 ) / 2)``.
     """
 
-    if torch.is_grad_enabled():
-        return InteractionFunc.apply(*args)
-    return torch.ops.torch_ipex.interaction_forward(args)
+    return interaction_list(args)
+
+
+def interaction_list(tensors):
+    r"""
+    Same as :func:`interaction`, but takes the feature tensors as an already
+    built list or tuple instead of varargs, so callers holding a sequence do
+    not pay for unpacking and re-packing it per call.
+
+    Args:
+        tensors (list or tuple): Tensors which represent different features.
+    """
+
+    if tensors[0].device.type != "cpu" or not _has_native_interaction():
+        # the native kernel is CPU only and registers only when the
+        # extension is built; everything else takes the composed fallback,
+        # which also differentiates through regular autograd.
+        return _interaction_fallback(tensors)
+    if len(tensors) == 1 and tensors[0].dim() == 3:
+        # a single pre-stacked (B, N, D) tensor (row 0 is the dense
+        # feature): must be resolved before the autograd branch, because
+        # the varargs kernel behind InteractionFunc expects 2-D features
+        # and would not reject the 3-D input in release builds.
+        if torch.is_grad_enabled() and tensors[0].requires_grad:
+            # the fused kernel has no backward of its own; training goes
+            # through the composed ops, like interaction_stacked.
+            return _interaction_fallback(tensors)
+        # use the fused op which writes the dense copy and the flat
+        # triangle straight into the output instead of re-gathering N
+        # separate rows. The kernel indexes the raw buffer, so hand it
+        # a contiguous tensor (a no-op unless the input is a view).
+        return torch.ops.torch_ipex.interaction_forward_stacked(
+            tensors[0].contiguous()
+        )
+    # only pay for the autograd machinery (graph node + saved tensors) when
+    # some input actually requires grad, e.g. not for frozen embeddings.
+    if torch.is_grad_enabled() and any(t.requires_grad for t in tensors):
+        return InteractionFunc.apply(*tensors)
+    return torch.ops.torch_ipex.interaction_forward(tensors)
+
+
+def interaction_stacked(x):
+    r"""
+    Variant of :func:`interaction` taking the features as one pre-stacked
+    contiguous tensor, as produced by ``torch.stack([dense, *embs], dim=1)``.
+    The single base pointer avoids juggling N separate storages in the kernel
+    and matches how DLRM assembles its features anyway.
+
+    Args:
+        x (torch.Tensor): Stacked features of shape ``(B, N, D)``; row 0 along
+            dim 1 is the dense feature.
+            Output shape: ``(B, D + N * ( N - 1 ) / 2)``.
+    """
+
+    if (
+        x.device.type != "cpu"
+        or not _has_native_interaction()
+        or (torch.is_grad_enabled() and x.requires_grad)
+    ):
+        # the fused kernel has no backward of its own; training goes through
+        # the composed ops, which differentiate via regular autograd.
+        return _interaction_fallback((x,))
+    # the kernel indexes the raw buffer, so hand it a contiguous tensor
+    # (a no-op unless the input is a view).
+    return torch.ops.torch_ipex.interaction_forward_stacked(x.contiguous())
+
+
+_HAS_NATIVE_INTERACTION = None
+
+
+def _has_native_interaction():
+    # probed lazily (not at import time) so the check runs after the
+    # extension's op library has had a chance to register, then cached:
+    # the hasattr on the lazy op namespace is not free per call.
+    global _HAS_NATIVE_INTERACTION
+    if _HAS_NATIVE_INTERACTION is None:
+        _HAS_NATIVE_INTERACTION = hasattr(torch.ops.torch_ipex, "interaction_forward")
+    return _HAS_NATIVE_INTERACTION
+
+
+# the strict-triangle index pattern only depends on the feature count, which
+# is fixed for a model, so build it once per (N, device) instead of per step.
+_TRIU_CACHE: dict = {}
+
+
+def _interaction_fallback(tensors):
+    # one bmm over the stacked features plus a single gather of the strict
+    # lower triangle, matching the flat layout the native kernel produces
+    # (pairs (i, j) with i > j, ordered by i then j; row 0 is the dense
+    # feature and is copied to the head of the output).
+    if len(tensors) == 1 and tensors[0].dim() == 3:
+        stacked = tensors[0]
+    else:
+        stacked = torch.stack(tensors, dim=1)
+    feature_nums = stacked.size(1)
+    dots = torch.bmm(stacked, stacked.transpose(1, 2))
+    cache_key = (feature_nums, stacked.device)
+    indices = _TRIU_CACHE.get(cache_key)
+    if indices is None:
+        indices = torch.tril_indices(
+            feature_nums, feature_nums, offset=-1, device=stacked.device
+        ).unbind(0)
+        _TRIU_CACHE[cache_key] = indices
+    li, lj = indices
+    return torch.cat([stacked[:, 0, :], dots[:, li, lj]], dim=1)
 
 
 class InteractionFunc(Function):
     @staticmethod
     def forward(ctx, *args):
         ctx.save_for_backward(*args)
+        # don't materialize a zeros grad_out when the output gradient is
+        # undefined; backward short-circuits on None instead.
+        ctx.set_materialize_grads(False)
         output = torch.ops.torch_ipex.interaction_forward(args)
         return output
 
     @staticmethod
     def backward(ctx, grad_out):
         args = ctx.saved_tensors
-        grad_in = torch.ops.torch_ipex.interaction_backward(grad_out.contiguous(), args)
-        return tuple(grad_in)
+        if grad_out is None:
+            return (None,) * len(args)
+        # the kernel requires a contiguous gradient; only copy when the
+        # upstream op actually handed us a non-contiguous view.
+        if not grad_out.is_contiguous():
+            grad_out = grad_out.contiguous()
+        grad_in = torch.ops.torch_ipex.interaction_backward(grad_out, args)
+        # hand back None for features that don't need grad (e.g. frozen
+        # embedding tables) so autograd skips accumulating into them and
+        # the unused gradient buffers free right away. This must stay a
+        # tuple: autograd treats a returned list as one single gradient.
+        return tuple(
+            g if needed else None for g, needed in zip(grad_in, ctx.needs_input_grad)
+        )
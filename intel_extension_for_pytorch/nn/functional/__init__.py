@@ -1,4 +1,9 @@
 from ...cpu.nn import _embeddingbag
 from . import _tensor_method
-from ...cpu.nn.interaction import interaction, InteractionFunc
+from ...cpu.nn.interaction import (
+    interaction,
+    interaction_list,
+    interaction_stacked,
+    InteractionFunc,
+)
 from ...cpu.nn import _roi_align_helper
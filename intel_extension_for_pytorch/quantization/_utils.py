@@ -1,7 +1,7 @@
 import enum
 import json
-from collections import OrderedDict
-from typing import Callable, Optional
+from collections import defaultdict
+from typing import Callable, Dict, Optional
 import inspect
 import numbers
 
@@ -9,6 +9,7 @@ import torch
 import torch.nn as nn
 from torch import _VF
 import torch.nn.functional as F
+from torch.ao.quantization import MinMaxObserver, PerChannelMinMaxObserver
 from torch.quantization.qconfig import QConfig
 from intel_extension_for_pytorch.nn.functional import interaction
 
@@ -80,6 +81,32 @@ int8_int8_ops = set(
 )
 
 
+# op sets used to sync scale/zp through pooling/shape/LSTM chains; built
+# once at module scope so the graph passes only pay O(1) hash lookups.
+_POOL_OPS = frozenset(
+    {
+        str(F.adaptive_avg_pool2d),
+        str(F.adaptive_avg_pool3d),
+        str(F.avg_pool2d),
+        str(F.avg_pool3d),
+        str(F.max_pool2d),
+        str(F.max_pool3d),
+        str(nn.MaxPool2d),
+        str(nn.MaxPool3d),
+        str(nn.AvgPool2d),
+        str(nn.AvgPool3d),
+        str(nn.AdaptiveAvgPool2d),
+        str(nn.AdaptiveAvgPool3d),
+    }
+)
+_SHAPE_OPS = frozenset(
+    {str(torch.flatten), str(torch.nn.Flatten), str(torch.Tensor.flatten)}
+)
+_RNN_OPS = frozenset({str(torch.nn.LSTM)})
+_SYNC_OPS = _POOL_OPS | _SHAPE_OPS | _RNN_OPS
+_SYNC_BEGIN_OPS = _POOL_OPS | _RNN_OPS
+
+
 class OpQuantizeabilityType(enum.Enum):
     QUANTIZEABLE = 0
     NOT_QUANTIZEABLE = 1
@@ -91,27 +118,42 @@ class FuncOutputObsType(enum.Enum):
     REUSES_FIRST_INPUT_OBS = 2
 
 
+# TODO(future PR): extend to the rest of the container classes
+_CONTAINER_CLASSES = (
+    torch.nn.Sequential,
+    torch.nn.ModuleList,
+)
+# leafness only depends on the module's type, so cache it per type
+_IS_LEAF_CACHE: Dict[type, bool] = {}
+
+
 # quantizeable modules
 def is_leaf(
     m: torch.nn.Module,
 ) -> bool:
-    # TODO(future PR): extend to the rest of the container classes
-    container_classes = (
-        torch.nn.Sequential,
-        torch.nn.ModuleList,
-    )
-    return m.__module__.startswith("torch.nn") and (
-        not isinstance(m, container_classes)
-    )
+    t = type(m)
+    r = _IS_LEAF_CACHE.get(t)
+    if r is None:
+        r = t.__module__.startswith("torch.nn") and not issubclass(
+            t, _CONTAINER_CLASSES
+        )
+        _IS_LEAF_CACHE[t] = r
+    return r
+
+
+_DOT_TO_COLON = str.maketrans(".", ":")
+_FQN_KEY_CACHE: Dict[str, str] = {}
 
 
 def get_fqn_valid_for_module_dict_key(fqn: str) -> str:
     """
     Modifies `fqn`(fully qualified name) to make it a valid key to a ModuleDict.
     """
-    if fqn == "":
-        fqn = " "
-    return fqn.replace(".", ":")
+    k = _FQN_KEY_CACHE.get(fqn)
+    if k is None:
+        k = " " if fqn == "" else fqn.translate(_DOT_TO_COLON)
+        _FQN_KEY_CACHE[fqn] = k
+    return k
 
 
 class HookType(enum.Enum):
@@ -141,23 +183,17 @@ def get_torch_function_hook_type(
     parent_module: Optional[torch.nn.Module],
     func: Callable,
 ) -> HookType:
-    # the direct __dict__ accesses are for performance, because
-    # the default `torch.nn.Module.__getattr__` has overhead.
-    parent_module_has_qstate = (
-        parent_module is not None and "_auto_quant_state" in parent_module.__dict__
-    )
-    needs_op_hooks = parent_module_has_qstate and parent_module.__dict__[
-        "_auto_quant_state"
-    ].cur_op_needs_hooks(
-        func
-    )  # type: ignore[union-attr, operator]
-
-    if needs_op_hooks:
-        return HookType.OP_HOOKS
-    elif parent_module_has_qstate:
-        return HookType.ARG_DEQUANTS
-    else:
+    # the direct __dict__ access is for performance, because the default
+    # `torch.nn.Module.__getattr__` has overhead; the common "no qstate"
+    # path is a single dict miss.
+    if parent_module is None:
         return HookType.NONE
+    qstate = parent_module.__dict__.get("_auto_quant_state")
+    if qstate is None:
+        return HookType.NONE
+    if qstate.cur_op_needs_hooks(func):  # type: ignore[union-attr, operator]
+        return HookType.OP_HOOKS
+    return HookType.ARG_DEQUANTS
 
 
 def get_module_hook_type(
@@ -167,12 +203,13 @@ def get_module_hook_type(
     cached_hook_type = getattr(cur_module, "_auto_quant_module_hook_type", None)
     if cached_hook_type is not None:
         return cached_hook_type
-    parent_module_has_qstate = (
-        parent_module is not None and "_auto_quant_state" in parent_module.__dict__
+    parent_qstate = (
+        parent_module.__dict__.get("_auto_quant_state")
+        if parent_module is not None
+        else None
     )
-    needs_op_hooks = parent_module_has_qstate and parent_module.__dict__[
-        "_auto_quant_state"
-    ].cur_op_needs_hooks(
+    parent_module_has_qstate = parent_qstate is not None
+    needs_op_hooks = parent_module_has_qstate and parent_qstate.cur_op_needs_hooks(
         cur_module
     )  # type: ignore[union-attr, operator]
     # We need IO hooks if
@@ -194,6 +231,58 @@ def get_module_hook_type(
     return result
 
 
+# observer types whose `calculate_qparams` just evaluates `_calculate_qparams`
+# elementwise on the recorded min/max buffers; qparams for a whole group of
+# them can be computed with one vectorized call on stacked buffers. Exact
+# type check on purpose: subclasses may override `calculate_qparams`.
+_BATCHABLE_OBSERVER_TYPES = (MinMaxObserver, PerChannelMinMaxObserver)
+
+
+def _calculate_qparams_batched(id_observer_pairs, scale_zp_dict):
+    """
+    Set `scale_zp_dict[id] = observer.calculate_qparams()` for every given
+    (id, observer) pair. MinMax style observers with identical settings are
+    grouped, their min/max buffers stacked, and the qparams of the whole
+    group computed with a single vectorized `_calculate_qparams` call,
+    which amortizes the per-observer Python and small-kernel overhead.
+    Histogram and unknown observer types keep the per-observer path.
+    """
+    groups = defaultdict(list)
+    for tensor_id, observer in id_observer_pairs:
+        if type(observer) in _BATCHABLE_OBSERVER_TYPES and _check_observer_has_run(
+            observer
+        ):
+            key = (
+                type(observer),
+                observer.dtype,
+                observer.qscheme,
+                observer.reduce_range,
+                observer.quant_min,
+                observer.quant_max,
+                observer.min_val.shape,
+            )
+            groups[key].append((tensor_id, observer))
+        else:
+            scale_zp_dict[tensor_id] = observer.calculate_qparams()
+    for group in groups.values():
+        if len(group) == 1:
+            tensor_id, observer = group[0]
+            scale_zp_dict[tensor_id] = observer.calculate_qparams()
+            continue
+        first_observer = group[0][1]
+        min_vals = torch.stack([observer.min_val for _, observer in group])
+        max_vals = torch.stack([observer.max_val for _, observer in group])
+        scales, zps = first_observer._calculate_qparams(min_vals, max_vals)
+        per_tensor = first_observer.min_val.dim() == 0
+        for i, (tensor_id, _) in enumerate(group):
+            if per_tensor:
+                # keep the 1-element 1-D shape `calculate_qparams` returns
+                # for per-tensor observers.
+                scale_zp_dict[tensor_id] = (scales[i : i + 1], zps[i : i + 1])
+            else:
+                scale_zp_dict[tensor_id] = (scales[i], zps[i])
+
+
 def attach_scale_zp_values_to_model(
     module: torch.nn.Module,
 ) -> None:
@@ -202,32 +291,37 @@ def attach_scale_zp_values_to_model(
     these values to the parent module. This is done to avoid recalculating
     these values at inference.
     """
-    if hasattr(module, "_auto_quant_state"):
-        qstate: AutoQuantizationState = module._auto_quant_state  # type: ignore[assignment]
-        quantized_dtype = [torch.quint8, torch.qint8]
+    quantized_dtype = (torch.quint8, torch.qint8)
+    # one bulk `modules()` walk is much cheaper than recursing through
+    # `named_children()`, which re-enters Python for every submodule.
+    for m in module.modules():
+        # the direct __dict__ access is for performance, because the default
+        # `torch.nn.Module.__getattr__` has overhead.
+        qstate = m.__dict__.get("_auto_quant_state", None)
+        if qstate is None:
+            continue
+        act_pairs = []
         for tensor_id, observer in qstate.tensor_id_to_observer.items():
             if observer.dtype in quantized_dtype:
-                scale, zp = observer.calculate_qparams()
-                qstate.tensor_id_to_scale_zp[int(tensor_id)] = (scale, zp)
+                act_pairs.append((int(tensor_id), observer))
             else:
                 AssertionError(
                     False
                 ), "The observer's dtype only can be torch.quint8 or torch.qint8"
+        _calculate_qparams_batched(act_pairs, qstate.tensor_id_to_scale_zp)
+        weight_pairs = []
         for tensor_id, observer in qstate.weight_tensor_id_to_observer.items():
             if observer.dtype in quantized_dtype:
-                scale, zp = observer.calculate_qparams()
-                qstate.weight_tensor_id_to_scale_zp[tensor_id] = (scale, zp)
+                weight_pairs.append((tensor_id, observer))
             else:
                 AssertionError(
                     False
                 ), "The observer's dtype only can be torch.quint8 or torch.qint8"
-        _attach_smooth_quant_scaling_factor_to_model(module)
+        _calculate_qparams_batched(weight_pairs, qstate.weight_tensor_id_to_scale_zp)
+        _attach_smooth_quant_scaling_factor_to_model(m)
         qstate.tensor_id_to_observer.clear()
         qstate.weight_tensor_id_to_observer.clear()
 
-    for _, child in module.named_children():
-        attach_scale_zp_values_to_model(child)
-
 
 def _check_observer_has_run(observer):
     if observer.min_val.numel() == 0 or observer.max_val.numel() == 0:
@@ -271,7 +365,14 @@ def check_model_obsever_has_run(
                     False
                 ), "The observer's dtype only can be torch.quint8 or torch.qint8"
 
-    for _, child in module.named_children():
+    children = module._modules
+    if not children:
+        return False
+    for child in children.values():
+        # _modules may hold None entries (e.g. an optional submodule set to
+        # None); named_children() used to filter those out.
+        if child is None:
+            continue
         if check_model_obsever_has_run(child):
             return True
 
@@ -286,8 +387,11 @@ def attach_op_convert_info_to_model(
     it to the parent module. This is done to avoid recalculating these values
     at inference.
     """
-    if hasattr(module, "_auto_quant_state"):
-        qstate: AutoQuantizationState = module._auto_quant_state  # type: ignore[assignment]
+    # same bulk `modules()` walk as `attach_scale_zp_values_to_model`.
+    for m in module.modules():
+        qstate = m.__dict__.get("_auto_quant_state", None)
+        if qstate is None:
+            continue
         for _, seen_q_op_info in qstate.idx_to_seen_q_op_infos.items():
             qstate.idx_to_op_convert_info[
                 seen_q_op_info.idx
@@ -295,10 +399,7 @@ def attach_op_convert_info_to_model(
             qstate.idx_to_op_weight_convert_info[
                 seen_q_op_info.idx
             ] = qstate.calculate_op_weight_convert_info(seen_q_op_info)
-        _map_smooth_quant_info_to_idx(module)
-
-    for _, child in module.named_children():
-        attach_op_convert_info_to_model(child)
+        _map_smooth_quant_info_to_idx(m)
 
 
 class Node:
@@ -384,64 +485,69 @@ def convert_quant_state_map_to_nodes(quant_state_map):
             new_node = Node(nonq_op_infos)
             nodes.append(new_node)
     # create connection between nodess
+    # index the producer and consumer nodes of every tensor_info once, so the
+    # pre/post links can be resolved with dict lookups instead of re-scanning
+    # all nodes for each node (O(N) vs O(N^2) w.r.t the number of nodes).
+    # QTensorInfo is a dataclass compared by value, so key the index on the
+    # same (id, orig_dtype, inf_dtype) value the old `in` check used.
+
+    def _tensor_info_key(tensor_info):
+        return (tensor_info.id, tensor_info.orig_dtype, tensor_info.inf_dtype)
+
+    producers = defaultdict(list)
+    consumers = defaultdict(list)
+    for n in nodes:
+        if isinstance(n, ParentNode):
+            continue
+        for output_info in n.output_tensor_infos:
+            if output_info is not None:
+                producers[_tensor_info_key(output_info)].append(n)
+        for input_info in n.input_tensor_infos:
+            if input_info is not None:
+                consumers[_tensor_info_key(input_info)].append(n)
     for cur in nodes:
         if isinstance(cur, ParentNode):
             continue
-        for n in nodes:
-            if isinstance(n, ParentNode):
-                continue
-            # find pre_node:
-            for input_info in cur.input_tensor_infos:
-                if input_info in n.output_tensor_infos:
-                    cur.pre_nodes.append(n)
-            # find nex_node:
-            for output_info in cur.output_tensor_infos:
-                if output_info in n.input_tensor_infos:
-                    cur.post_nodes.append(n)
+        for input_info in cur.input_tensor_infos:
+            if input_info is not None:
+                cur.pre_nodes.extend(producers.get(_tensor_info_key(input_info), ()))
+        for output_info in cur.output_tensor_infos:
+            if output_info is not None:
+                cur.post_nodes.extend(consumers.get(_tensor_info_key(output_info), ()))
     return nodes
 
 
 def sync_pool_and_lstm_input_output_scale_zp(quant_state_map, nodes):
-    pool_ops = [
-        str(F.adaptive_avg_pool2d),
-        str(F.adaptive_avg_pool3d),
-        str(F.avg_pool2d),
-        str(F.avg_pool3d),
-        str(F.max_pool2d),
-        str(F.max_pool3d),
-        str(nn.MaxPool2d),
-        str(nn.MaxPool3d),
-        str(nn.AvgPool2d),
-        str(nn.AvgPool3d),
-        str(nn.AdaptiveAvgPool2d),
-        str(nn.AdaptiveAvgPool3d),
-    ]
-    shape_ops = [str(torch.flatten), str(torch.nn.Flatten), str(torch.Tensor.flatten)]
-    rnn_ops = [str(torch.nn.LSTM)]
+    # reverse index from tensor id to the qstates holding a scale/zp for it,
+    # so each sync is a dict hit instead of a scan over quant_state_map.
+    id_to_qstates = defaultdict(list)
+    for _, v in quant_state_map.items():
+        for tensor_id in v.tensor_id_to_scale_zp:
+            id_to_qstates[tensor_id].append(v)
 
-    def _sync_scale_zp_given_id(quant_state_map, id, scale_zp):
-        for _, v in quant_state_map.items():
-            if id in v.tensor_id_to_scale_zp:
-                v.tensor_id_to_scale_zp[id] = scale_zp
+    def _sync_scale_zp_given_id(id, scale_zp):
+        for qstate in id_to_qstates.get(id, ()):
+            qstate.tensor_id_to_scale_zp[id] = scale_zp
 
     def _find_sync_op_from_given_node(cur_node, ids):
         for next in cur_node.post_nodes:
-            if next.type in (pool_ops + shape_ops + rnn_ops):
+            if next.type in _SYNC_OPS:
                 ids.append(next.output_tensor_infos[0].id)
                 _find_sync_op_from_given_node(next, ids)
 
     for node in nodes:
         if isinstance(node, ParentNode):
             continue
-        if node.qconfig is not None and node.type in (pool_ops + rnn_ops):
+        if node.qconfig is not None and node.type in _SYNC_BEGIN_OPS:
             if node.input_scale_zero == node.output_scale_zero:
                 continue
             sync_node_begin = node
             # fistly, find the fist sync op before the cur pooling(lstm) op.
             # like: pooling->pool->shape->cur_node,
-            while len(sync_node_begin.pre_nodes) == 1 and sync_node_begin.pre_nodes[
-                0
-            ].type in (pool_ops + shape_ops + rnn_ops):
+            while (
+                len(sync_node_begin.pre_nodes) == 1
+                and sync_node_begin.pre_nodes[0].type in _SYNC_OPS
+            ):
                 sync_node_begin = sync_node_begin.pre_nodes[0]
             tensor_ids = [sync_node_begin.output_tensor_infos[0].id]
             scale_zp = sync_node_begin.input_scale_zero[
@@ -450,7 +556,7 @@ def sync_pool_and_lstm_input_output_scale_zp(quant_state_map, nodes):
             # find all need sync op from sync_node_begin.
             _find_sync_op_from_given_node(sync_node_begin, tensor_ids)
             for id in tensor_ids:
-                _sync_scale_zp_given_id(quant_state_map, id, scale_zp)
+                _sync_scale_zp_given_id(id, scale_zp)
 
 
 def _check_after_nodes_all_quantized_give_node(node):
@@ -601,30 +707,54 @@ dtype_dict = {
     str(torch.quint4x2): torch.quint4x2,
 }
 
+# cache the string form of torch.dtype/torch.qscheme objects: str() on them
+# re-enters the C API every call and is repeated for every tensor info when
+# serializing large models.
+_STR_CACHE: dict = {}
+
+
+def _dtype_str(value) -> str:
+    cached = _STR_CACHE.get(value)
+    if cached is None:
+        cached = str(value)
+        _STR_CACHE[value] = cached
+    return cached
+
+
 IPEX_OBSERVERS = {
     "SmoothQuantActivationObserver": SmoothQuantActivationObserver,
     "SmoothQuantWeightObserver": SmoothQuantWeightObserver,
 }
 
 
-def _get_observer_setting(observer):
-    r"""
-    Convert torch observer's args to dict for saving to json file.
-    Because json only accept number or string, so we will convert some
-    class type to string(dtype, qscheme, other class type?).
-    """
-    observer_setting = OrderedDict()
+# per-class cache of __init__ argument names: inspect.signature re-parses
+# the signature on every call and the same few observer classes are
+# serialized hundreds of times when saving a large model.
+_OBS_ARGS_CACHE: dict = {}
+
+# per-class cache of compiled serializers, see _compile_observer_serializer.
+_OBS_SERIALIZER_CACHE: dict = {}
+
+
+def _get_observer_setting_generic(observer):
+    # reflection path, used when a specialized serializer cannot be compiled
+    # for the observer's class.
+    observer_setting = {}
     observer_setting["name"] = observer.__class__.__name__
     # get observer arg name
-    observer_args = inspect.signature(observer.__init__).parameters
+    cls = type(observer)
+    observer_args = _OBS_ARGS_CACHE.get(cls)
+    if observer_args is None:
+        observer_args = tuple(inspect.signature(cls.__init__).parameters)
+        _OBS_ARGS_CACHE[cls] = observer_args
     observer_dict = observer.__dict__
     # Now we only can save number or string to json file.
-    for arg_name in observer_args.keys():
+    for arg_name in observer_args:
         if arg_name in observer_dict:
             if isinstance(observer_dict[arg_name], numbers.Number):
                 observer_setting[arg_name] = observer_dict[arg_name]
             elif arg_name == "qscheme" or arg_name == "dtype":
-                observer_setting[arg_name] = str(observer_dict[arg_name])
+                observer_setting[arg_name] = _dtype_str(observer_dict[arg_name])
             elif (
                 arg_name == "eps"
                 and hasattr(observer, "eps")
@@ -635,6 +765,61 @@ def _get_observer_setting(observer):
     return observer_setting
 
 
+def _compile_observer_serializer(cls):
+    # the set of __init__ args of an observer class is static, so compile
+    # the reflection loop down to straight-line dict construction once per
+    # class instead of re-walking the arg list per serialized observer.
+    lines = [
+        "def _serialize(observer):",
+        "    d = observer.__dict__",
+        "    setting = {'name': %r}" % cls.__name__,
+    ]
+    for arg_name in inspect.signature(cls.__init__).parameters:
+        if arg_name == "self":
+            continue
+        if arg_name in ("qscheme", "dtype"):
+            lines.append("    if %r in d:" % arg_name)
+            lines.append(
+                "        setting[%r] = _dtype_str(d[%r])" % (arg_name, arg_name)
+            )
+        elif arg_name == "eps":
+            lines.append("    v = d.get('eps')")
+            lines.append("    if isinstance(v, _Number):")
+            lines.append("        setting['eps'] = v")
+            lines.append("    elif isinstance(v, _Tensor) and v.numel() == 1:")
+            lines.append("        setting['eps'] = v.item()")
+        else:
+            lines.append("    v = d.get(%r)" % arg_name)
+            lines.append("    if isinstance(v, _Number):")
+            lines.append("        setting[%r] = v" % arg_name)
+    lines.append("    return setting")
+    namespace = {
+        "_dtype_str": _dtype_str,
+        "_Number": numbers.Number,
+        "_Tensor": torch.Tensor,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_serialize"]
+
+
+def _get_observer_setting(observer):
+    r"""
+    Convert torch observer's args to dict for saving to json file.
+    Because json only accept number or string, so we will convert some
+    class type to string(dtype, qscheme, other class type?).
+    """
+    cls = type(observer)
+    serializer = _OBS_SERIALIZER_CACHE.get(cls)
+    if serializer is None:
+        try:
+            serializer = _compile_observer_serializer(cls)
+        except (ValueError, SyntaxError):
+            # e.g. no inspectable signature; keep the generic path.
+            serializer = _get_observer_setting_generic
+        _OBS_SERIALIZER_CACHE[cls] = serializer
+    return serializer(observer)
+
+
 def _create_observer(setting):
     r"""
     Create torch observer according to user's setting.
@@ -666,248 +851,217 @@ def _create_observer(setting):
         raise NameError("torch.quantization.observer %s not found" % setting["name"])
 
 
+def _tensor_info_to_dict(
+    tensor_info, scale_zp_to_save=None, include_id=True, force_dtype=None
+):
+    # serialize the fields shared by every tensor_info section of the qconf
+    # summary; smooth quant extras are appended by the caller.
+    cur_tensor_infos = {}
+    if tensor_info is None:
+        return cur_tensor_infos
+    if include_id:
+        cur_tensor_infos["id"] = tensor_info.id
+    cur_tensor_infos["orig_dtype"] = _dtype_str(tensor_info.orig_dtype)
+    cur_tensor_infos["inf_dtype"] = _dtype_str(tensor_info.inf_dtype)
+    if force_dtype is not None:
+        cur_tensor_infos["force_dtype"] = _dtype_str(force_dtype)
+    if scale_zp_to_save is not None and tensor_info.id in scale_zp_to_save:
+        scales_to_save, zp_to_save = scale_zp_to_save[tensor_info.id]
+        cur_tensor_infos["scale"] = scales_to_save
+        cur_tensor_infos["zero_point"] = zp_to_save
+    return cur_tensor_infos
+
+
 def save_quant_state(quant_state_map, configure_file):
-    # save qparam's as json file for tunning
-    quant_state_dict = OrderedDict()
-    for k, v in quant_state_map.items():
-        layer_infos = OrderedDict()
-        if len(v.idx_to_seen_q_op_infos) == 0:
-            layer_infos["q_op_infos"] = {}
-        else:
-            q_op_infos = OrderedDict()
-            for q_k, op_info in v.idx_to_seen_q_op_infos.items():
-                info = OrderedDict()
-                info["op_type"] = op_info.type
-                info["op_type_is_module"] = op_info.type_is_module
-                info["fqn"] = op_info.fqn
-                input_tensor_infos = []
-                smooth_quant_enabled = False
-                for tensor_info, force_dtype in zip(
-                    op_info.input_tensor_infos, op_info.input_tensor_force_inf_dtype
-                ):
-                    cur_tensor_infos = {}
-
-                    if tensor_info is not None:
-                        cur_tensor_infos["id"] = tensor_info.id
-                        cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                        cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                        cur_tensor_infos["force_dtype"] = str(force_dtype)
-                        if tensor_info.id in v.tensor_id_to_scale_zp:
-                            if isinstance(
-                                v.tensor_id_to_scale_zp[tensor_info.id][0], torch.Tensor
-                            ):
-                                cur_tensor_infos["scale"] = v.tensor_id_to_scale_zp[
-                                    tensor_info.id
-                                ][0].tolist()
-                                cur_tensor_infos[
-                                    "zero_point"
-                                ] = v.tensor_id_to_scale_zp[tensor_info.id][1].tolist()
-                            else:
-                                scales_dict = v.tensor_id_to_scale_zp[tensor_info.id][0]
-                                zp_dict = v.tensor_id_to_scale_zp[tensor_info.id][1]
-                                assert isinstance(scales_dict, dict) and isinstance(
-                                    zp_dict, dict
-                                )
-                                scales_to_save = {}
-                                zp_to_save = {}
-                                for key, val in scales_dict.items():
-                                    scales_to_save.update({key: val.tolist()})
-                                for key, val in zp_dict.items():
-                                    zp_to_save.update({key: val.tolist()})
-                                cur_tensor_infos["scale"] = scales_to_save
-                                cur_tensor_infos["zero_point"] = zp_to_save
-                        if (
-                            str(tensor_info.id)
-                            in v.tensor_id_to_smooth_quant_scaling_factor
-                            and v.tensor_id_to_smooth_quant_scaling_factor[
+    # save qparam's as json file for tunning. Encode and write each layer as
+    # soon as it is built, so the full state never lives twice in memory
+    # (once as Python objects and once in the JSON encoder) on big models.
+    if configure_file is None:
+        return
+    with open(configure_file, "w") as fp:
+        fp.write("{")
+        first_layer = True
+        for k, v in quant_state_map.items():
+            # serialize each (scale, zp) pair once per layer: the same tensor id
+            # is referenced by the input, output and layer-output sections.
+            scale_zp_to_save = {}
+            for tensor_id, (scale, zp) in v.tensor_id_to_scale_zp.items():
+                if isinstance(scale, torch.Tensor):
+                    scale_zp_to_save[tensor_id] = (scale.tolist(), zp.tolist())
+                else:
+                    assert isinstance(scale, dict) and isinstance(zp, dict)
+                    scale_zp_to_save[tensor_id] = (
+                        {key: val.tolist() for key, val in scale.items()},
+                        {key: val.tolist() for key, val in zp.items()},
+                    )
+            weight_scale_zp_to_save = {
+                weight_idx: (scale.tolist(), zp.tolist())
+                for weight_idx, (scale, zp) in v.weight_tensor_id_to_scale_zp.items()
+            }
+            layer_infos = {}
+            if len(v.idx_to_seen_q_op_infos) == 0:
+                layer_infos["q_op_infos"] = {}
+            else:
+                q_op_infos = {}
+                for q_k, op_info in v.idx_to_seen_q_op_infos.items():
+                    info = {}
+                    info["op_type"] = op_info.type
+                    info["op_type_is_module"] = op_info.type_is_module
+                    info["fqn"] = op_info.fqn
+                    input_tensor_infos = []
+                    smooth_quant_enabled = False
+                    for tensor_info, force_dtype in zip(
+                        op_info.input_tensor_infos, op_info.input_tensor_force_inf_dtype
+                    ):
+                        cur_tensor_infos = _tensor_info_to_dict(
+                            tensor_info, scale_zp_to_save, force_dtype=force_dtype
+                        )
+                        if tensor_info is not None:
+                            if (
                                 str(tensor_info.id)
-                            ]
-                            is not None
-                        ):
-                            scaling_factor_dict = (
-                                v.tensor_id_to_smooth_quant_scaling_factor[
+                                in v.tensor_id_to_smooth_quant_scaling_factor
+                                and v.tensor_id_to_smooth_quant_scaling_factor[
                                     str(tensor_info.id)
                                 ]
-                            )
-                            assert isinstance(scaling_factor_dict, dict)
-                            scaling_factors_to_save = {}
-                            for key, val in scaling_factor_dict.items():
-                                scaling_factors_to_save.update({key: val.tolist()})
-                            cur_tensor_infos[
-                                "smooth_quant_scaling_factor"
-                            ] = scaling_factors_to_save
-                            smooth_quant_enabled = True
-                    input_tensor_infos.append(cur_tensor_infos)
-                info["input_tensor_infos"] = input_tensor_infos
-                # weight infos
-                weight_tensor_infos = []
-                for tensor_info in op_info.weight_tensor_infos:
-                    cur_tensor_infos = {}
-                    if tensor_info is not None:
-                        cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                        cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                        weight_idx = str(op_info.idx) + "_" + str(tensor_info.id)
-                        if weight_idx in v.weight_tensor_id_to_scale_zp:
-                            cur_tensor_infos["scale"] = v.weight_tensor_id_to_scale_zp[
-                                weight_idx
-                            ][0].tolist()
-                            cur_tensor_infos[
-                                "zero_point"
-                            ] = v.weight_tensor_id_to_scale_zp[weight_idx][1].tolist()
-                        if (
-                            weight_idx
-                            in v.weight_tensor_id_to_smooth_quant_scaling_factor
-                        ):
-                            if (
-                                v.weight_tensor_id_to_smooth_quant_scaling_factor[
-                                    weight_idx
-                                ]
                                 is not None
                             ):
+                                scaling_factor_dict = (
+                                    v.tensor_id_to_smooth_quant_scaling_factor[
+                                        str(tensor_info.id)
+                                    ]
+                                )
+                                assert isinstance(scaling_factor_dict, dict)
+                                scaling_factors_to_save = {}
+                                for key, val in scaling_factor_dict.items():
+                                    scaling_factors_to_save.update({key: val.tolist()})
                                 cur_tensor_infos[
                                     "smooth_quant_scaling_factor"
-                                ] = v.weight_tensor_id_to_smooth_quant_scaling_factor[
-                                    weight_idx
-                                ].tolist()
-                    weight_tensor_infos.append(cur_tensor_infos)
-                info["weight_tensor_infos"] = weight_tensor_infos
-                # output infos
-                output_tensor_infos = []
-                for tensor_info in op_info.output_tensor_infos:
-                    cur_tensor_infos = {}
-                    if tensor_info is not None:
-                        cur_tensor_infos["id"] = tensor_info.id
-                        cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                        cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                        if tensor_info.id in v.tensor_id_to_scale_zp:
-                            if isinstance(
-                                v.tensor_id_to_scale_zp[tensor_info.id][0], torch.Tensor
+                                ] = scaling_factors_to_save
+                                smooth_quant_enabled = True
+                        input_tensor_infos.append(cur_tensor_infos)
+                    info["input_tensor_infos"] = input_tensor_infos
+                    # weight infos
+                    weight_tensor_infos = []
+                    for tensor_info in op_info.weight_tensor_infos:
+                        cur_tensor_infos = _tensor_info_to_dict(
+                            tensor_info, include_id=False
+                        )
+                        if tensor_info is not None:
+                            weight_idx = str(op_info.idx) + "_" + str(tensor_info.id)
+                            if weight_idx in weight_scale_zp_to_save:
+                                (
+                                    cur_tensor_infos["scale"],
+                                    cur_tensor_infos["zero_point"],
+                                ) = weight_scale_zp_to_save[weight_idx]
+                            if (
+                                weight_idx
+                                in v.weight_tensor_id_to_smooth_quant_scaling_factor
                             ):
-                                cur_tensor_infos["scale"] = v.tensor_id_to_scale_zp[
-                                    tensor_info.id
-                                ][0].tolist()
-                                cur_tensor_infos[
-                                    "zero_point"
-                                ] = v.tensor_id_to_scale_zp[tensor_info.id][1].tolist()
-                            else:
-                                scales_dict = v.tensor_id_to_scale_zp[tensor_info.id][0]
-                                zp_dict = v.tensor_id_to_scale_zp[tensor_info.id][1]
-                                assert isinstance(scales_dict, dict) and isinstance(
-                                    zp_dict, dict
+                                if (
+                                    v.weight_tensor_id_to_smooth_quant_scaling_factor[
+                                        weight_idx
+                                    ]
+                                    is not None
+                                ):
+                                    cur_tensor_infos[
+                                        "smooth_quant_scaling_factor"
+                                    ] = v.weight_tensor_id_to_smooth_quant_scaling_factor[
+                                        weight_idx
+                                    ].tolist()
+                        weight_tensor_infos.append(cur_tensor_infos)
+                    info["weight_tensor_infos"] = weight_tensor_infos
+                    # output infos
+                    output_tensor_infos = []
+                    for tensor_info in op_info.output_tensor_infos:
+                        cur_tensor_infos = _tensor_info_to_dict(
+                            tensor_info, scale_zp_to_save
+                        )
+                        if tensor_info is not None:
+                            if (
+                                str(tensor_info.id)
+                                in v.tensor_id_to_smooth_quant_scaling_factor
+                            ):
+                                scaling_factors = (
+                                    v.tensor_id_to_smooth_quant_scaling_factor[
+                                        str(tensor_info.id)
+                                    ]
                                 )
-                                scales_to_save = {}
-                                zp_to_save = {}
-                                for key, val in scales_dict.items():
-                                    scales_to_save.update({key: val.tolist()})
-                                for key, val in zp_dict.items():
-                                    zp_to_save.update({key: val.tolist()})
-                                cur_tensor_infos["scale"] = scales_to_save
-                                cur_tensor_infos["zero_point"] = zp_to_save
-                        if (
-                            str(tensor_info.id)
-                            in v.tensor_id_to_smooth_quant_scaling_factor
-                        ):
-                            scaling_factors = (
-                                v.tensor_id_to_smooth_quant_scaling_factor[
-                                    str(tensor_info.id)
-                                ]
-                            )
-                            scaling_factors_to_save = None
-                            if scaling_factors is not None:
-                                assert isinstance(
-                                    scaling_factors, dict
-                                ), f"Expect scaling factors is a dict but found {type(scaling_factors)}"
-                                scaling_factors_to_save = {}
-                                for key, val in scaling_factors.items():
-                                    scaling_factors_to_save.update({key: val.tolist()})
-                            cur_tensor_infos[
-                                "smooth_quant_scaling_factor"
-                            ] = scaling_factors_to_save
-                    output_tensor_infos.append(cur_tensor_infos)
-                info["output_tensor_infos"] = output_tensor_infos
-                # qconfig
-                info["activation_observer"] = _get_observer_setting(
-                    op_info.qconfig.activation()
-                )
-                if isinstance(
-                    op_info.qconfig.activation(), SmoothQuantActivationObserver
-                ):
-                    info["activation_observer"][
-                        "smooth_quant_enabled"
-                    ] = smooth_quant_enabled
-                    info["activation_observer"]["act_observer"] = _get_observer_setting(
-                        op_info.qconfig.activation().act_obs
-                    )
-                    info["activation_observer"][
-                        "act_ic_observer"
-                    ] = _get_observer_setting(op_info.qconfig.activation().ic_obs)
-                    info["share_weight_observers"] = getattr(
-                        op_info.qconfig, "share_weight_observers", True
-                    )
-                info["weight_observer"] = _get_observer_setting(
-                    op_info.qconfig.weight()
-                )
-                if isinstance(op_info.qconfig.weight(), SmoothQuantWeightObserver):
-                    info["weight_observer"][
-                        "smooth_quant_enabled"
-                    ] = smooth_quant_enabled
-                    info["weight_observer"]["wei_observer"] = _get_observer_setting(
-                        op_info.qconfig.weight().oc_obs
+                                scaling_factors_to_save = None
+                                if scaling_factors is not None:
+                                    assert isinstance(
+                                        scaling_factors, dict
+                                    ), f"Expect scaling factors is a dict but found {type(scaling_factors)}"
+                                    scaling_factors_to_save = {}
+                                    for key, val in scaling_factors.items():
+                                        scaling_factors_to_save.update({key: val.tolist()})
+                                cur_tensor_infos[
+                                    "smooth_quant_scaling_factor"
+                                ] = scaling_factors_to_save
+                        output_tensor_infos.append(cur_tensor_infos)
+                    info["output_tensor_infos"] = output_tensor_infos
+                    # qconfig
+                    info["activation_observer"] = _get_observer_setting(
+                        op_info.qconfig.activation()
                     )
-                    info["weight_observer"]["wei_ic_observer"] = _get_observer_setting(
-                        op_info.qconfig.weight().ic_obs
+                    if isinstance(
+                        op_info.qconfig.activation(), SmoothQuantActivationObserver
+                    ):
+                        info["activation_observer"][
+                            "smooth_quant_enabled"
+                        ] = smooth_quant_enabled
+                        info["activation_observer"]["act_observer"] = _get_observer_setting(
+                            op_info.qconfig.activation().act_obs
+                        )
+                        info["activation_observer"][
+                            "act_ic_observer"
+                        ] = _get_observer_setting(op_info.qconfig.activation().ic_obs)
+                        info["share_weight_observers"] = getattr(
+                            op_info.qconfig, "share_weight_observers", True
+                        )
+                    info["weight_observer"] = _get_observer_setting(
+                        op_info.qconfig.weight()
                     )
-                q_op_infos[q_k] = info
-            layer_infos["q_op_infos"] = q_op_infos
-        if len(v.seen_nonq_op_infos) == 0:
-            layer_infos["nonq_op_infos"] = {}
-        else:
-            nonq_op_infos = OrderedDict()
-            for non_q_k, op_info in enumerate(v.seen_nonq_op_infos):
-                info = OrderedDict()
-                info["op_type"] = op_info.type
-                info["fqn"] = op_info.fqn
-                input_tensor_infos = []
-                for tensor_info in op_info.input_tensor_infos:
-                    cur_tensor_infos = {}
-                    if tensor_info is not None:
-                        cur_tensor_infos["id"] = tensor_info.id
-                        cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                        cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                    input_tensor_infos.append(cur_tensor_infos)
-                info["input_tensor_infos"] = input_tensor_infos
-                output_tensor_infos = []
-                for tensor_info in op_info.output_tensor_infos:
-                    cur_tensor_infos = {}
-                    if tensor_info is not None:
-                        cur_tensor_infos["id"] = tensor_info.id
-                        cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                        cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                    output_tensor_infos.append(cur_tensor_infos)
-                info["output_tensor_infos"] = output_tensor_infos
-                nonq_op_infos[non_q_k] = info
-            layer_infos["nonq_op_infos"] = nonq_op_infos
-        layer_output_infos = []
-        for tensor_info in v.output_qtensor_infos:
-            cur_tensor_infos = {}
-            if tensor_info is not None:
-                cur_tensor_infos["id"] = tensor_info.id
-                cur_tensor_infos["orig_dtype"] = str(tensor_info.orig_dtype)
-                cur_tensor_infos["inf_dtype"] = str(tensor_info.inf_dtype)
-                if tensor_info.id in v.tensor_id_to_scale_zp:
-                    cur_tensor_infos["scale"] = v.tensor_id_to_scale_zp[tensor_info.id][
-                        0
-                    ].tolist()
-                    cur_tensor_infos["zero_point"] = v.tensor_id_to_scale_zp[
-                        tensor_info.id
-                    ][1].tolist()
-            layer_output_infos.append(cur_tensor_infos)
-        layer_infos["layer_output_infos"] = layer_output_infos
-        quant_state_dict[k] = layer_infos
-    # save qparms as json file
-    if configure_file is not None:
-        with open(configure_file, "w") as fp:
-            json.dump(quant_state_dict, fp, indent=4)
+                    if isinstance(op_info.qconfig.weight(), SmoothQuantWeightObserver):
+                        info["weight_observer"][
+                            "smooth_quant_enabled"
+                        ] = smooth_quant_enabled
+                        info["weight_observer"]["wei_observer"] = _get_observer_setting(
+                            op_info.qconfig.weight().oc_obs
+                        )
+                        info["weight_observer"]["wei_ic_observer"] = _get_observer_setting(
+                            op_info.qconfig.weight().ic_obs
+                        )
+                    q_op_infos[q_k] = info
+                layer_infos["q_op_infos"] = q_op_infos
+            if len(v.seen_nonq_op_infos) == 0:
+                layer_infos["nonq_op_infos"] = {}
+            else:
+                nonq_op_infos = {}
+                for non_q_k, op_info in enumerate(v.seen_nonq_op_infos):
+                    info = {}
+                    info["op_type"] = op_info.type
+                    info["fqn"] = op_info.fqn
+                    info["input_tensor_infos"] = [
+                        _tensor_info_to_dict(tensor_info)
+                        for tensor_info in op_info.input_tensor_infos
+                    ]
+                    info["output_tensor_infos"] = [
+                        _tensor_info_to_dict(tensor_info)
+                        for tensor_info in op_info.output_tensor_infos
+                    ]
+                    nonq_op_infos[non_q_k] = info
+                layer_infos["nonq_op_infos"] = nonq_op_infos
+            layer_infos["layer_output_infos"] = [
+                _tensor_info_to_dict(tensor_info, scale_zp_to_save)
+                for tensor_info in v.output_qtensor_infos
+            ]
+            # json.dumps({k: layer_infos}, indent=4) yields exactly what
+            # json.dump would emit for this key at top level; strip the
+            # outer braces and stitch the per-layer chunks together.
+            fp.write("\n" if first_layer else ",\n")
+            fp.write(json.dumps({k: layer_infos}, indent=4)[2:-2])
+            first_layer = False
+        fp.write("}" if first_layer else "\n}")
 
 
 def load_qconf_summary_to_model(model, qconf_summary):
@@ -920,11 +1074,18 @@ def load_qconf_summary_to_model(model, qconf_summary):
     for k, v in quant_state_map.items():
         layer_info = quant_state_dict[k]
         user_q_op_infos = layer_info["q_op_infos"]
+        tensor_id_to_scale_zp = v.tensor_id_to_scale_zp
+        weight_tensor_id_to_scale_zp = v.weight_tensor_id_to_scale_zp
         for i, q_op_info in user_q_op_infos.items():
+            # bind the op info and parsed index once: they are referenced
+            # many times per iteration below.
+            idx_i = int(i)
             fqn = q_op_info["fqn"]
-            cur_fqn = v.idx_to_seen_q_op_infos[int(i)].fqn
+            # check the index before dereferencing: a stale summary should
+            # fail with the diagnostic message, not a bare KeyError.
+            cur_q_op_info = v.idx_to_seen_q_op_infos.get(idx_i)
             assert (
-                int(i) in v.idx_to_seen_q_op_infos and cur_fqn == fqn
+                cur_q_op_info is not None and cur_q_op_info.fqn == fqn
             ), "Loaded quantizable op info doesn't match the current model quantizable op info"
             input_tensor_infos = []
             input_force_dtype_infos = []
@@ -942,8 +1103,8 @@ def load_qconf_summary_to_model(model, qconf_summary):
                     )
                     if "scale" in tensor_info:
                         if isinstance(tensor_info["scale"], list):
-                            scale = torch.FloatTensor(tensor_info["scale"])
-                            zp = torch.LongTensor(tensor_info["zero_point"])
+                            scale = torch.tensor(tensor_info["scale"], dtype=torch.float32)
+                            zp = torch.tensor(tensor_info["zero_point"], dtype=torch.int64)
                         else:
                             scale, zp = {}, {}
                             scale_to_load = tensor_info["scale"]
@@ -955,12 +1116,12 @@ def load_qconf_summary_to_model(model, qconf_summary):
                                 f"found types {type(scale_to_load)} and {type(zp_to_load)}"
                             )
                             for key, val in scale_to_load.items():
-                                s = torch.FloatTensor(val)
+                                s = torch.tensor(val, dtype=torch.float32)
                                 scale.update({key: s})
                             for key, val in zp_to_load.items():
-                                z = torch.LongTensor(val)
+                                z = torch.tensor(val, dtype=torch.int64)
                                 zp.update({key: z})
-                        v.tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
+                        tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
                     if "smooth_quant_scaling_factor" in tensor_info:
                         scaling_factors = {}
                         scaling_factors_to_load = tensor_info[
@@ -971,7 +1132,7 @@ def load_qconf_summary_to_model(model, qconf_summary):
                             f"{type(scaling_factors_to_load)}"
                         )
                         for key, val in scaling_factors_to_load.items():
-                            scaling_factor = torch.FloatTensor(val)
+                            scaling_factor = torch.tensor(val, dtype=torch.float32)
                             scaling_factors.update({key: scaling_factor})
                         v.tensor_id_to_smooth_quant_scaling_factor[
                             str(tensor_info["id"])
@@ -991,14 +1152,15 @@ def load_qconf_summary_to_model(model, qconf_summary):
                         )
                     )
                     if "scale" in tensor_info:
-                        scale = torch.FloatTensor(tensor_info["scale"])
-                        zp = torch.LongTensor(tensor_info["zero_point"])
-                        v.weight_tensor_id_to_scale_zp[
-                            str(i) + "_" + str(weight_idx)
+                        scale = torch.tensor(tensor_info["scale"], dtype=torch.float32)
+                        zp = torch.tensor(tensor_info["zero_point"], dtype=torch.int64)
+                        weight_tensor_id_to_scale_zp[
+                            str(idx_i) + "_" + str(weight_idx)
                         ] = (scale, zp)
                     if "smooth_quant_scaling_factor" in tensor_info:
-                        scaling_factor = torch.FloatTensor(
-                            tensor_info["smooth_quant_scaling_factor"]
+                        scaling_factor = torch.tensor(
+                            tensor_info["smooth_quant_scaling_factor"],
+                            dtype=torch.float32,
                         )
                         v.weight_tensor_id_to_smooth_quant_scaling_factor[
                             str(i) + "_" + str(weight_idx)
@@ -1019,9 +1181,9 @@ def load_qconf_summary_to_model(model, qconf_summary):
                     )
                     insert_fake_quant_after_outputs.append(False)
                     if "scale" in tensor_info:
-                        scale = torch.FloatTensor(tensor_info["scale"])
-                        zp = torch.LongTensor(tensor_info["zero_point"])
-                        v.tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
+                        scale = torch.tensor(tensor_info["scale"], dtype=torch.float32)
+                        zp = torch.tensor(tensor_info["zero_point"], dtype=torch.int64)
+                        tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
                 else:
                     output_tensor_infos.append(None)
             activation_observer = q_op_info["activation_observer"]
@@ -1040,16 +1202,14 @@ def load_qconf_summary_to_model(model, qconf_summary):
                     weight=_create_observer(weight_observer),
                 )
             # overide the cur model's info
-            v.idx_to_seen_q_op_infos[int(i)].input_tensor_infos = input_tensor_infos
-            v.idx_to_seen_q_op_infos[
-                int(i)
-            ].input_tensor_force_inf_dtype = input_force_dtype_infos
-            v.idx_to_seen_q_op_infos[int(i)].output_tensor_infos = output_tensor_infos
-            v.idx_to_seen_q_op_infos[
-                int(i)
-            ].insert_fake_quant_after_outputs = insert_fake_quant_after_outputs
-            v.idx_to_seen_q_op_infos[int(i)].weight_tensor_infos = weight_tensor_infos
-            v.idx_to_seen_q_op_infos[int(i)].qconfig = qconfig
+            cur_q_op_info.input_tensor_infos = input_tensor_infos
+            cur_q_op_info.input_tensor_force_inf_dtype = input_force_dtype_infos
+            cur_q_op_info.output_tensor_infos = output_tensor_infos
+            cur_q_op_info.insert_fake_quant_after_outputs = (
+                insert_fake_quant_after_outputs
+            )
+            cur_q_op_info.weight_tensor_infos = weight_tensor_infos
+            cur_q_op_info.qconfig = qconfig
 
         user_nonq_op_infos = layer_info["nonq_op_infos"]
         # v.seen_nonq_op_infos.clear()
@@ -1099,9 +1259,9 @@ def load_qconf_summary_to_model(model, qconf_summary):
                     )
                 )
                 if "scale" in tensor_info:
-                    scale = torch.FloatTensor(tensor_info["scale"])
-                    zp = torch.LongTensor(tensor_info["zero_point"])
-                    v.tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
+                    scale = torch.tensor(tensor_info["scale"], dtype=torch.float32)
+                    zp = torch.tensor(tensor_info["zero_point"], dtype=torch.int64)
+                    tensor_id_to_scale_zp[tensor_info["id"]] = (scale, zp)
             else:
                 layer_output_info.append(None)
         v.output_qtensor_infos = layer_output_info
@@ -1117,24 +1277,38 @@ def load_qconf_summary_to_model(model, qconf_summary):
     set_node_output_quantized(nodes)
 
 
+def _raise_hx_dim_mismatch(hx, is_batched):
+    # error-path only helper: keep the f-string formation off the happy path
+    if is_batched:
+        msg = (
+            "For batched 3-D input, hx and cx should "
+            f"also be 3-D but got ({hx[0].dim()}-D, {hx[1].dim()}-D) tensors"
+        )
+    else:
+        msg = (
+            "For unbatched 2-D input, hx and cx should "
+            f"also be 2-D but got ({hx[0].dim()}-D, {hx[1].dim()}-D) tensors"
+        )
+    raise RuntimeError(msg)
+
+
 def _lstm_forward(module, input, hx, weights):
     r"""
     LSTM forward function.
     """
     orig_input = input
     # xxx: isinstance check needs to be in conditional for TorchScript to compile
-    # batch_sizes = None
-    if isinstance(orig_input, torch.nn.utils.rnn.PackedSequence):
+    is_packed = isinstance(orig_input, torch.nn.utils.rnn.PackedSequence)
+    if is_packed:
         input, batch_sizes, sorted_indices, unsorted_indices = input
-        max_batch_size = batch_sizes[0]
-        max_batch_size = int(max_batch_size)
+        max_batch_size = int(batch_sizes[0])
     else:
         batch_sizes = None
-        is_batched = input.dim() == 3
         batch_dim = 0 if module.batch_first else 1
+        is_batched = input.dim() == 3
         if not is_batched:
             input = input.unsqueeze(batch_dim)
-        max_batch_size = input.size(0) if module.batch_first else input.size(1)
+        max_batch_size = input.size(batch_dim)
         sorted_indices = None
         unsorted_indices = None
     if hx is None:
@@ -1161,18 +1335,10 @@ def _lstm_forward(module, input, hx, weights):
         if batch_sizes is None:  # If not PackedSequence input.
             if is_batched:
                 if hx[0].dim() != 3 or hx[1].dim() != 3:
-                    msg = (
-                        "For batched 3-D input, hx and cx should "
-                        f"also be 3-D but got ({hx[0].dim()}-D, {hx[1].dim()}-D) tensors"
-                    )
-                    raise RuntimeError(msg)
+                    _raise_hx_dim_mismatch(hx, is_batched)
             else:
                 if hx[0].dim() != 2 or hx[1].dim() != 2:
-                    msg = (
-                        "For unbatched 2-D input, hx and cx should "
-                        f"also be 2-D but got ({hx[0].dim()}-D, {hx[1].dim()}-D) tensors"
-                    )
-                    raise RuntimeError(msg)
+                    _raise_hx_dim_mismatch(hx, is_batched)
                 hx = (hx[0].unsqueeze(1), hx[1].unsqueeze(1))
 
         # Each batch of the hidden state should match the input sequence that
@@ -1180,16 +1346,24 @@ def _lstm_forward(module, input, hx, weights):
         hx = module.permute_hidden(hx, sorted_indices)
 
     module.check_forward_args(input, hx, batch_sizes)
+    # _VF.lstm runs every layer and direction inside one native call; the
+    # remaining Python cost here is the module attribute lookups, so read
+    # them once.
+    bias = module.bias
+    num_layers = module.num_layers
+    dropout = module.dropout
+    training = module.training
+    bidirectional = module.bidirectional
     if batch_sizes is None:
         result = _VF.lstm(
             input,
             hx,
             weights,
-            module.bias,
-            module.num_layers,
-            module.dropout,
-            module.training,
-            module.bidirectional,
+            bias,
+            num_layers,
+            dropout,
+            training,
+            bidirectional,
             module.batch_first,
         )
     else:
@@ -1198,16 +1372,15 @@ def _lstm_forward(module, input, hx, weights):
             batch_sizes,
             hx,
             weights,
-            module.bias,
-            module.num_layers,
-            module.dropout,
-            module.training,
-            module.bidirectional,
+            bias,
+            num_layers,
+            dropout,
+            training,
+            bidirectional,
         )
     output = result[0]
     hidden = result[1:]
-    # xxx: isinstance check needs to be in conditional for TorchScript to compile
-    if isinstance(orig_input, torch.nn.utils.rnn.PackedSequence):
+    if is_packed:
         output_packed = torch.nn.utils.rnn.PackedSequence(
             output, batch_sizes, sorted_indices, unsorted_indices
         )
@@ -1219,44 +1392,82 @@ def _lstm_forward(module, input, hx, weights):
         return output, module.permute_hidden(hidden, unsorted_indices)
 
 
-def module_call_to_function_call(module, args, weights):
-    r"""
-    This function is a help function which replace nn.module call to funtion call, which implement
-    the nn.module's forward function.
-    """
-    if isinstance(module, torch.nn.Conv2d) or isinstance(module, torch.nn.Conv3d):
-        output = module._conv_forward(args[0], weights[0], module.bias)
-    elif isinstance(module, torch.nn.Linear):
-        output = F.linear(args[0], weights[0], module.bias)
-    elif isinstance(module, torch.nn.EmbeddingBag):
-        output = F.embedding_bag(
-            args[0],
-            weights[0],
-            args[1],
-            module.max_norm,
-            module.norm_type,
-            module.scale_grad_by_freq,
-            module.mode,
-            module.sparse,
-            args[2] if len(args) == 3 else None,
-            module.include_last_offset,
-            module.padding_idx,
-        )
-    elif isinstance(module, MergedEmbeddingBagWithCat):
-        output = torch.ops.torch_ipex.merged_embeddingbag_cat_forward(
-            weights, args[0], args[1], args[2]
-        )
-    elif isinstance(module, torch.nn.ConvTranspose2d) or isinstance(
-        module, torch.nn.ConvTranspose3d
-    ):
-        if module.padding_mode != "zeros":
-            raise ValueError(
-                "Only `zeros` padding mode is supported for ConvTranspose2d"
-            )
-        assert isinstance(module.padding, tuple)
-        # One cannot replace List by Tuple or Sequence in "_output_padding" because
-        # TorchScript does not support `Sequence[T]` or `Tuple[T, ...]`.
-        output_size = args[1] if len(args) == 2 else None
+def _conv_module_call(module, args, weights):
+    return module._conv_forward(args[0], weights[0], module.bias)
+
+
+def _linear_module_call(module, args, weights):
+    return F.linear(args[0], weights[0], module.bias)
+
+
+def _embedding_bag_module_call(module, args, weights):
+    return F.embedding_bag(
+        args[0],
+        weights[0],
+        args[1],
+        module.max_norm,
+        module.norm_type,
+        module.scale_grad_by_freq,
+        module.mode,
+        module.sparse,
+        args[2] if len(args) == 3 else None,
+        module.include_last_offset,
+        module.padding_idx,
+    )
+
+
+def _merged_embeddingbag_cat_module_call(module, args, weights):
+    return torch.ops.torch_ipex.merged_embeddingbag_cat_forward(
+        weights, args[0], args[1], args[2]
+    )
+
+
+# _output_padding is a pure function of the input shape and the conv
+# geometry, so its result can be memoized across forward calls (input
+# shapes repeat during calibration and deployed inference).
+_OUTPUT_PADDING_CACHE: dict = {}
+
+# bound once so the per-forward dispatch below is a pointer compare plus a
+# local load instead of chained attribute lookups.
+_CT2D = torch.nn.ConvTranspose2d
+_CT3D = torch.nn.ConvTranspose3d
+_F_conv_transpose2d = F.conv_transpose2d
+_F_conv_transpose3d = F.conv_transpose3d
+_CT_DISPATCH = {
+    _CT2D: _F_conv_transpose2d,
+    _CT3D: _F_conv_transpose3d,
+}
+
+
+def _conv_transpose_module_call(module, args, weights):
+    if module.padding_mode != "zeros":
+        raise ValueError("Only `zeros` padding mode is supported for ConvTranspose2d")
+    # hoist the module attributes used below into locals: each is looked up
+    # at least twice per call otherwise.
+    stride = module.stride
+    padding = module.padding
+    kernel_size = module.kernel_size
+    dilation = module.dilation
+    input = args[0]
+    weight = weights[0]
+    assert isinstance(padding, tuple)
+    # One cannot replace List by Tuple or Sequence in "_output_padding" because
+    # TorchScript does not support `Sequence[T]` or `Tuple[T, ...]`.
+    output_size = args[1] if len(args) == 2 else None
+    # module.output_padding must be part of the key: with output_size=None,
+    # _output_padding just returns it, so two modules differing only in
+    # output_padding would otherwise share a cache entry.
+    cache_key = (
+        tuple(input.shape),
+        None if output_size is None else tuple(output_size),
+        stride,
+        padding,
+        kernel_size,
+        dilation,
+        module.output_padding,
+    )
+    output_padding = _OUTPUT_PADDING_CACHE.get(cache_key)
+    if output_padding is None:
         # master code
         """
         num_spatial_dims = 2 if isinstance(module, torch.nn.ConvTranspose2d) else 3
@@ -1265,41 +1476,82 @@ def module_call_to_function_call(module, args, weights):
                         num_spatial_dims, module.dilation)
         """
         output_padding = module._output_padding(
-            args[0],
+            input,
             output_size,
-            module.stride,
-            module.padding,
-            module.kernel_size,
-            module.dilation,
+            stride,
+            padding,
+            kernel_size,
+            dilation,
         )
         # output_padding = module._output_padding(*arg_to)
-        if isinstance(module, torch.nn.ConvTranspose2d):
-            output = F.conv_transpose2d(
-                args[0],
-                weights[0],
-                module.bias,
-                module.stride,
-                module.padding,
-                output_padding,
-                module.groups,
-                module.dilation,
-            )
-        else:
-            output = F.conv_transpose3d(
-                args[0],
-                weights[0],
-                module.bias,
-                module.stride,
-                module.padding,
-                output_padding,
-                module.groups,
-                module.dilation,
-            )
-    elif isinstance(module, torch.nn.LSTM):
-        output = _lstm_forward(
-            module, args[0], args[1] if len(args) == 2 else None, weights
+        _OUTPUT_PADDING_CACHE[cache_key] = output_padding
+    conv_transpose = _CT_DISPATCH.get(type(module))
+    if conv_transpose is None:
+        # subclasses miss the exact-type lookup
+        conv_transpose = (
+            _F_conv_transpose2d if isinstance(module, _CT2D) else _F_conv_transpose3d
         )
-    return output
+    if input.is_cuda and input.dtype in (torch.float16, torch.bfloat16):
+        # cuDNN only picks the Tensor Core backward-data algorithms for
+        # NHWC-like layouts; with the default NCHW it can fall back to a
+        # far slower generic kernel (pytorch/pytorch#41382). The formats
+        # only exist for batched inputs (channels_last is 4-D only,
+        # channels_last_3d is 5-D only), so leave unbatched inputs alone.
+        if conv_transpose is _F_conv_transpose2d and input.dim() == 4:
+            memory_format = torch.channels_last
+        elif conv_transpose is _F_conv_transpose3d and input.dim() == 5:
+            memory_format = torch.channels_last_3d
+        else:
+            memory_format = None
+        if memory_format is not None:
+            input = input.contiguous(memory_format=memory_format)
+            weight = weight.to(memory_format=memory_format)
+    return conv_transpose(
+        input,
+        weight,
+        module.bias,
+        stride,
+        padding,
+        output_padding,
+        module.groups,
+        dilation,
+    )
+
+
+def _lstm_module_call(module, args, weights):
+    return _lstm_forward(
+        module, args[0], args[1] if len(args) == 2 else None, weights
+    )
+
+
+# exact module type -> function call handler; avoids walking an isinstance
+# cascade on every op replay. Keep the insertion order in sync with the
+# original isinstance checks so the subclass fallback resolves the same way.
+_MODULE_CALL_DISPATCH = {
+    torch.nn.Conv2d: _conv_module_call,
+    torch.nn.Conv3d: _conv_module_call,
+    torch.nn.Linear: _linear_module_call,
+    torch.nn.EmbeddingBag: _embedding_bag_module_call,
+    MergedEmbeddingBagWithCat: _merged_embeddingbag_cat_module_call,
+    torch.nn.ConvTranspose2d: _conv_transpose_module_call,
+    torch.nn.ConvTranspose3d: _conv_transpose_module_call,
+    torch.nn.LSTM: _lstm_module_call,
+}
+
+
+def module_call_to_function_call(module, args, weights):
+    r"""
+    This function is a help function which replace nn.module call to funtion call, which implement
+    the nn.module's forward function.
+    """
+    handler = _MODULE_CALL_DISPATCH.get(type(module))
+    if handler is None:
+        # subclasses miss the exact-type lookup; fall back to isinstance.
+        for module_cls, module_call in _MODULE_CALL_DISPATCH.items():
+            if isinstance(module, module_cls):
+                handler = module_call
+                break
+    return handler(module, args, weights)
 
 
 def _attach_smooth_quant_scaling_factor_to_model(module):
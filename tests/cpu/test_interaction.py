@@ -1,6 +1,7 @@
 import unittest
 import torch
 import intel_extension_for_pytorch as ipex
+from intel_extension_for_pytorch.cpu.nn.interaction import _interaction_fallback
 from common_utils import TestCase
 import itertools
 
@@ -83,6 +84,47 @@ class TestInteractionCases(TestCase):
                     ly1[i].grad, ly2[i].grad, rtol=rtol, atol=atol
                 )
 
+    def test_interaction_fallback(self):
+        # the composed fallback is the only implementation on non-CPU devices
+        # and in builds without the native op, so pin its flat-triangle layout
+        # (and its autograd path) to the native kernel's.
+        dtypes = [torch.float32, torch.bfloat16]
+        feature_sizes = [127, 128]
+        for dtype, feature_size in itertools.product(dtypes, feature_sizes):
+            features = [
+                torch.randn([128, feature_size]).to(dtype).clone().detach().requires_grad_()
+                for _ in range(27)
+            ]
+            clones = [f.clone().detach().requires_grad_() for f in features]
+            if dtype == torch.bfloat16:
+                # same rationale as test_interaction: the native kernel and
+                # the composed ops accumulate bf16 products differently.
+                rtol, atol = 0.005, 0.1
+            else:
+                rtol, atol = None, None
+            with torch.no_grad():
+                expected = torch.ops.torch_ipex.interaction_forward(
+                    [f.detach() for f in features]
+                )
+            actual = _interaction_fallback(clones)
+            torch.testing.assert_allclose(actual, expected, rtol=rtol, atol=atol)
+            ref = ipex.nn.functional.InteractionFunc.apply(*features)
+            ref.sum().backward()
+            actual.sum().backward()
+            for f, c in zip(features, clones):
+                torch.testing.assert_allclose(c.grad, f.grad, rtol=rtol, atol=atol)
+
+    def test_interaction_stacked(self):
+        dtypes = [torch.float32, torch.bfloat16]
+        feature_sizes = [127, 128]
+        for dtype, feature_size in itertools.product(dtypes, feature_sizes):
+            features = [torch.randn([128, feature_size]).to(dtype) for _ in range(27)]
+            stacked = torch.stack(features, dim=1).contiguous()
+            with torch.no_grad():
+                expected = ipex.nn.functional.interaction(*features)
+                actual = ipex.nn.functional.interaction_stacked(stacked)
+            torch.testing.assert_allclose(actual, expected)
+
 
 if __name__ == "__main__":
     test = unittest.main()